@@ -1,13 +1,17 @@
 import sys
-import random
 import sqlite3
 import json
 import queue
-from datetime import datetime
-from collections import deque
-
+import socket
+import threading
+import time
+import numpy as np
 import paho.mqtt.client as mqtt
-from PyQt5.QtCore import Qt, QTimer
+try:  # optional: serializes several times faster than stdlib json
+    import orjson
+except ImportError:
+    orjson = None
+from PyQt5.QtCore import Qt, QTimer, QObject, pyqtSignal
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout,
     QListWidget, QListWidgetItem, QFrame, QGridLayout, QMessageBox
@@ -21,84 +25,235 @@ MQTT_HOST = "broker.hivemq.com"
 MQTT_PORT = 1883
 MQTT_TOPIC = "gym/project"
 TEMP_THRESHOLD = 30.0
+MAX_LOG_ITEMS = 500
+DEBUG_LOG = False  # set True to echo log lines to stderr
+
+# Kept at module scope so the batched writer always reuses the same
+# statement text (SQLite caches the prepared plan per SQL string).
+INSERT_SQL = "INSERT INTO sensor_data (timestamp, temperature, humidity, relay_status) VALUES (?, ?, ?, ?)"
+
+# Fixed-schema sensor payload: %-formatting into a byte template is much
+# cheaper than building a dict and running it through a JSON encoder.
+SENSOR_PAYLOAD_FMT = b'{"type":"sensor","temperature":%.2f,"humidity":%.2f}'
+
+# Timestamps only change once a second, so cache the formatted string and
+# pay for strftime at most once per second regardless of message rate.
+_last_sec = 0
+_last_str = ""
+
+def _now_str():
+    global _last_sec, _last_str
+    s = int(time.time())
+    if s != _last_sec:
+        _last_sec = s
+        _last_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(s))
+    return _last_str
 
 # ---------------------- DATABASE ----------------------
 class DataManager:
     def __init__(self, db_name=DB_FILE):
         self.conn = sqlite3.connect(db_name, check_same_thread=False)
-        self.cur = self.conn.cursor()
+        # WAL mode: writes append to the log instead of rewriting pages,
+        # so inserts need far fewer fsyncs and readers are never blocked.
+        # Not applicable to in-memory databases.
+        if db_name != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("PRAGMA wal_autocheckpoint=1000")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-8000")
         self.create_table()
+        # All disk writes happen on a dedicated thread so the Qt event loop
+        # never waits on an fsync (check_same_thread=False allows this).
+        self._write_q = queue.Queue()
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
 
     def create_table(self):
-        self.cur.execute('''
+        self.conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        self._migrate_legacy_table()
+        # STRICT keeps rows compact; timestamp is integer unix seconds
+        # (half the bytes of a text date, no strftime on the write path).
+        self.conn.execute('''
             CREATE TABLE IF NOT EXISTS sensor_data (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT,
+                id INTEGER PRIMARY KEY,
+                timestamp INTEGER,
                 temperature REAL,
                 humidity REAL,
                 relay_status INTEGER
-            )
+            ) STRICT
         ''')
         self.conn.commit()
 
+    def _migrate_legacy_table(self):
+        # Databases created before the STRICT schema stored timestamps as
+        # 'YYYY-MM-DD HH:MM:SS' text (and TEXT affinity would turn even new
+        # integer inserts into strings). Rebuild such tables in place so an
+        # existing sensor_data.db keeps working after an upgrade.
+        cols = self.conn.execute("PRAGMA table_info(sensor_data)").fetchall()
+        ts_type = next((c[2].upper() for c in cols if c[1] == "timestamp"), None)
+        if ts_type != "TEXT":
+            return
+        with self.conn:
+            self.conn.execute('''
+                CREATE TABLE sensor_data_migrated (
+                    id INTEGER PRIMARY KEY,
+                    timestamp INTEGER,
+                    temperature REAL,
+                    humidity REAL,
+                    relay_status INTEGER
+                ) STRICT
+            ''')
+            # strftime handles 'YYYY-MM-DD HH:MM:SS' text (the 'utc'
+            # modifier treats it as localtime, which is how the old code
+            # wrote it); the CASE fallback covers rows where unix seconds
+            # were already stored as text. Anything else becomes NULL.
+            self.conn.execute('''
+                INSERT INTO sensor_data_migrated (id, timestamp, temperature, humidity, relay_status)
+                SELECT id, COALESCE(CAST(strftime('%s', timestamp, 'utc') AS INTEGER),
+                                    CASE WHEN timestamp NOT GLOB '*[^0-9]*' AND timestamp != ''
+                                         THEN CAST(timestamp AS INTEGER) END),
+                       temperature, humidity, relay_status
+                FROM sensor_data
+            ''')
+            self.conn.execute("DROP TABLE sensor_data")
+            self.conn.execute("ALTER TABLE sensor_data_migrated RENAME TO sensor_data")
+
     def insert(self, timestamp, temp, hum, relay_status):
-        self.cur.execute(
-            "INSERT INTO sensor_data (timestamp, temperature, humidity, relay_status) VALUES (?, ?, ?, ?)",
-            (timestamp, temp, hum, relay_status)
-        )
-        self.conn.commit()
+        # Non-blocking: hand the row to the writer thread.
+        self._write_q.put((timestamp, temp, hum, relay_status))
+
+    def _writer_loop(self):
+        while True:
+            row = self._write_q.get()
+            if row is None:
+                break
+            rows = [row]
+            # Drain whatever else is already queued so many rows share a
+            # single transaction (one commit/fsync per batch).
+            while len(rows) < 64:
+                try:
+                    row = self._write_q.get_nowait()
+                except queue.Empty:
+                    break
+                if row is None:
+                    self._write_q.put(None)  # keep the shutdown signal
+                    break
+                rows.append(row)
+            # A failed batch (locked database, full disk) must not kill
+            # the thread — it owns all persistence. Drop the batch and
+            # keep consuming.
+            try:
+                with self.conn:
+                    self.conn.executemany(INSERT_SQL, rows)
+            except sqlite3.Error as e:
+                print(f"DB write failed, dropping {len(rows)} row(s): {e}", file=sys.stderr)
 
     def get_last_records(self, limit=10):
-        self.cur.execute(
+        return self.conn.execute(
             "SELECT timestamp, temperature, humidity, relay_status FROM sensor_data ORDER BY id DESC LIMIT ?",
             (limit,)
-        )
-        return self.cur.fetchall()
+        ).fetchall()
+
+    def checkpoint(self):
+        # Truncate the WAL file back to zero so it cannot grow unbounded.
+        try:
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.Error:
+            pass
 
     def close(self):
+        self._write_q.put(None)
+        self._writer.join(timeout=2)
+        if self._writer.is_alive():
+            # Writer is stuck mid-batch; don't close the connection
+            # underneath it (the daemon thread dies with the process).
+            return
+        self.checkpoint()
         self.conn.close()
 
 # ---------------------- MQTT ----------------------
-class MqttClientWrapper:
-    def __init__(self, host, port, topic, incoming_queue: queue.Queue, clientName="AC_Client"):
+class MqttClientWrapper(QObject):
+    # Emitted from the paho network thread; delivered to the GUI thread
+    # through a queued connection, so messages reach the UI as they
+    # arrive instead of waiting for a polling tick.
+    message_received = pyqtSignal(object)
+
+    def __init__(self, host, port, topic, clientName="AC_Client"):
+        super().__init__()
         self.host = host
         self.port = port
         self.topic = topic
-        self.queue = incoming_queue
         self.client = mqtt.Client(client_id=clientName)
+        # Sensor updates are last-value-wins telemetry: keep the outgoing
+        # queue small so a slow broker drops stale readings instead of
+        # buffering them without bound.
+        self.client.max_inflight_messages_set(1)
+        self.client.max_queued_messages_set(10)
         self.client.on_connect = self.on_connect
         self.client.on_message = self.on_message
         self.client.on_disconnect = self.on_disconnect
         self.connected = False
+        self._pub_buf = []
+
+    def start(self):
+        # Called by the dashboard after message_received is connected, so
+        # a connect_error (or an early on_connect from the paho thread)
+        # is never emitted into a signal with no receivers.
         try:
             self.client.connect(self.host, self.port, keepalive=60)
             self.client.loop_start()
         except Exception as e:
-            self.queue.put({"type": "sys", "event": "connect_error", "error": str(e)})
+            self.message_received.emit({"type": "sys", "event": "connect_error", "error": str(e)})
 
     def on_connect(self, client, userdata, flags, rc):
         self.connected = (rc == 0)
         if self.connected:
             self.client.subscribe(self.topic)
-        self.queue.put({"type": "sys", "event": "connected" if rc==0 else "connect_failed", "rc": rc})
+            # Disable Nagle so small publishes go out immediately instead
+            # of waiting ~40ms for an ACK-coalesced segment.
+            try:
+                self.client.socket().setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except Exception:
+                pass
+        self.message_received.emit({"type": "sys", "event": "connected" if rc==0 else "connect_failed", "rc": rc})
 
     def on_disconnect(self, client, userdata, rc):
         self.connected = False
-        self.queue.put({"type": "sys", "event": "disconnected", "rc": rc})
+        self.message_received.emit({"type": "sys", "event": "disconnected", "rc": rc})
 
     def on_message(self, client, userdata, msg):
-        payload = msg.payload.decode(errors="ignore")
+        # Runs on the paho network thread: parse the bytes directly (no
+        # intermediate str copy) so we return to the socket loop quickly.
         try:
-            data = json.loads(payload)
+            data = orjson.loads(msg.payload) if orjson else json.loads(msg.payload)
         except Exception:
-            data = {"raw": payload}
-        self.queue.put(data)
+            data = {"raw": msg.payload.decode(errors="ignore")}
+        self.message_received.emit(data)
 
     def publish(self, data):
+        # Accepts a dict or an already-serialized bytes payload. Payloads
+        # are buffered and sent together by flush() so one TCP segment
+        # carries the whole tick's worth of messages.
+        try:
+            if not isinstance(data, bytes):
+                data = orjson.dumps(data) if orjson else json.dumps(data).encode()
+            self._pub_buf.append(data)
+        except Exception as e:
+            self.message_received.emit({"type": "sys", "event": "publish_error", "error": str(e)})
+
+    def flush(self):
+        if not self._pub_buf:
+            return
         try:
-            self.client.publish(self.topic, json.dumps(data))
+            if len(self._pub_buf) == 1:
+                payload = self._pub_buf[0]
+            else:
+                payload = b'{"type":"batch","items":[' + b",".join(self._pub_buf) + b']}'
+            self.client.publish(self.topic, payload, qos=0, retain=False)
         except Exception as e:
-            self.queue.put({"type": "sys", "event": "publish_error", "error": str(e)})
+            self.message_received.emit({"type": "sys", "event": "publish_error", "error": str(e)})
+        self._pub_buf.clear()
 
     def stop(self):
         try:
@@ -109,14 +264,42 @@ class MqttClientWrapper:
 
 # ---------------------- PLOT ----------------------
 class MplCanvas(FigureCanvas):
-    def __init__(self, parent=None, width=6, height=3, dpi=100):
-        fig = Figure(figsize=(width, height), dpi=dpi, tight_layout=True)
+    def __init__(self, parent=None, width=6, height=3, dpi=100, max_points=200):
+        # Fixed margins instead of tight_layout: the layout solver would
+        # otherwise run again on every draw for an unchanging axes setup.
+        fig = Figure(figsize=(width, height), dpi=dpi, tight_layout=False)
+        fig.subplots_adjust(left=0.08, right=0.98, top=0.95, bottom=0.12)
         self.ax = fig.add_subplot(111)
         super().__init__(fig)
         self.setParent(parent)
+        # Static parts (axes, labels, grid, legend) are drawn once; each
+        # update only blits the two animated line artists on top of the
+        # cached background instead of re-rendering the whole figure.
+        self.line_t, = self.ax.plot([], [], label="Temperature", animated=True)
+        self.line_h, = self.ax.plot([], [], label="Humidity", animated=True)
+        self.ax.set_xlabel("Samples (newest → right)")
+        self.ax.set_ylabel("Value")
+        self.ax.set_xlim(0, max_points)
+        self.ax.set_ylim(0, 100)
+        self.ax.grid(True)
+        self.ax.legend(loc="upper left")
+        self.bg = None
+
+    def cache_background(self):
+        self.draw()
+        self.bg = self.copy_from_bbox(self.ax.bbox)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.bg = None  # stale after resize; rebuilt on the next update
 
 # ---------------------- DASHBOARD ----------------------
 class ACDashboard(QWidget):
+    # Cached QSS: setStyleSheet re-parses CSS every call, so it is only
+    # invoked when the relay state actually changes.
+    _STYLE_ON = "background-color: green; border-radius:6px;"
+    _STYLE_OFF = "background-color: gray; border-radius:6px;"
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("AC Dashboard")
@@ -125,24 +308,45 @@ class ACDashboard(QWidget):
         # DB
         self.db = DataManager()
 
-        # MQTT
-        self.mqtt_queue = queue.Queue()
-        self.mqtt = MqttClientWrapper(MQTT_HOST, MQTT_PORT, MQTT_TOPIC, self.mqtt_queue)
+        # MQTT: messages arrive through a queued signal, so the UI reacts
+        # as soon as they are delivered instead of on a polling tick.
+        self.mqtt = MqttClientWrapper(MQTT_HOST, MQTT_PORT, MQTT_TOPIC)
+        self.mqtt.message_received.connect(self._handle_msg, Qt.QueuedConnection)
+        self._handlers = {
+            "sensor": self._on_sensor,
+            "button_pressed": self._on_button,
+            "sys": self._on_sys,
+        }
+        self.mqtt.start()
 
         # Sensor & relay states
         self.temp = 24.0
         self.hum = 50.0
         self.relay_on = False
+        self._relay_applied = None  # relay state the stylesheet reflects
+        self._temp_shown = None     # label text currently displayed
+        self._hum_shown = None
 
-        # History
+        # History: preallocated float32 ring buffers, no per-sample
+        # allocation and Matplotlib gets contiguous arrays directly.
         self.max_points = 200
-        self.times = deque(maxlen=self.max_points)
-        self.temps = deque(maxlen=self.max_points)
-        self.hums = deque(maxlen=self.max_points)
-
-        # Timers
+        self.temps = np.empty(self.max_points, dtype=np.float32)
+        self.hums = np.empty(self.max_points, dtype=np.float32)
+        self._head = 0  # next write position (== oldest sample once full)
+        self._n = 0     # number of valid samples
+        self._x = np.arange(self.max_points)
+        self._plot_dirty = False  # set when new samples arrive
+
+        # Simulator randomness: one vectorized draw covers 1024 ticks
+        # (temp in [20,32), humidity in [30,70)).
+        self._rng = np.random.default_rng()
+        self._rand_buf = self._rng.uniform(size=(1024,2)) * np.array([12,40]) + np.array([20,30])
+        self._rand_i = 0
+
+        # Timer only drives the simulator and the plot redraw now;
+        # incoming messages are handled event-driven via the signal.
         self.update_timer = QTimer()
-        self.update_timer.setInterval(5000)  # כל 5 שניות
+        self.update_timer.setInterval(1000)  # כל שנייה
         self.update_timer.timeout.connect(self.on_update)
         self.update_timer.start()
 
@@ -153,7 +357,7 @@ class ACDashboard(QWidget):
         top_layout = QHBoxLayout()
 
         # Plot
-        self.canvas = MplCanvas(self, width=7, height=4)
+        self.canvas = MplCanvas(self, width=7, height=4, max_points=self.max_points)
         top_layout.addWidget(self.canvas, 3)
 
         # Right panel
@@ -171,7 +375,8 @@ class ACDashboard(QWidget):
         status_grid.addWidget(QLabel("Relay:"),2,0)
         self.relay_indicator = QLabel()
         self.relay_indicator.setFixedSize(40,40)
-        self.relay_indicator.setStyleSheet("background-color: gray; border-radius:6px;")
+        self.relay_indicator.setStyleSheet(self._STYLE_OFF)
+        self._relay_applied = False
         status_grid.addWidget(self.relay_indicator,2,1)
         right_layout.addLayout(status_grid)
 
@@ -188,6 +393,11 @@ class ACDashboard(QWidget):
         # Logs
         right_layout.addWidget(QLabel("Logs / Warnings:"))
         self.list_logs = QListWidget()
+        # Uniform item sizes + batched layout keep appends O(1); log()
+        # also caps the list so geometry and memory stay bounded.
+        self.list_logs.setUniformItemSizes(True)
+        self.list_logs.setLayoutMode(QListWidget.Batched)
+        self.list_logs.setBatchSize(32)
         right_layout.addWidget(self.list_logs,1)
 
         right_frame.setLayout(right_layout)
@@ -197,75 +407,133 @@ class ACDashboard(QWidget):
         self.setLayout(main_layout)
 
     def log(self,text):
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        ts = _now_str()
+        if self.list_logs.count() >= MAX_LOG_ITEMS:
+            self.list_logs.takeItem(0)
         item = QListWidgetItem(f"{ts} - {text}")
         self.list_logs.addItem(item)
         self.list_logs.scrollToBottom()
-        print(f"{ts} - {text}")
+        if DEBUG_LOG:
+            print(f"{ts} - {text}", file=sys.stderr)
 
     def manual_button_pressed(self):
         data = {"type":"button_pressed"}
         self.mqtt.publish(data)
+        self.mqtt.flush()  # user interaction → send right away, don't batch
         self.log("Manual button pressed → MQTT published")
 
     def simulate_sensor(self):
-        self.temp = round(random.uniform(20,32),2)
-        self.hum = round(random.uniform(30,70),2)
-        data = {"type":"sensor","temperature":self.temp,"humidity":self.hum}
-        self.mqtt.publish(data)
-
-    def process_mqtt_queue(self):
-        while not self.mqtt_queue.empty():
-            msg = self.mqtt_queue.get_nowait()
-            if isinstance(msg, dict):
-                # Sensor reading
-                if msg.get("type")=="sensor":
-                    t = msg.get("temperature")
-                    h = msg.get("humidity")
-                    if t is not None and h is not None:
-                        self.temp = t
-                        self.hum = h
-                        self.lbl_temp.setText(f"{t:.1f}")
-                        self.lbl_hum.setText(f"{h:.1f}")
-                        self.times.append(datetime.now().strftime("%H:%M:%S"))
-                        self.temps.append(t)
-                        self.hums.append(h)
-                        # Warnings
-                        if t>=TEMP_THRESHOLD:
-                            self.log(f"⚠️ High temperature: {t:.1f}°C")
-                        # Auto relay
-                        self.relay_on = t>=TEMP_THRESHOLD or msg.get("manual_override", False)
-                        self.relay_indicator.setStyleSheet("background-color: green;" if self.relay_on else "background-color: gray;")
-                        # Save DB
-                        self.db.insert(datetime.now().strftime("%Y-%m-%d %H:%M:%S"),t,h,int(self.relay_on))
-                # Button press
-                if msg.get("type")=="button_pressed":
-                    # Toggle relay
-                    self.relay_on = not self.relay_on
-                    self.relay_indicator.setStyleSheet("background-color: green;" if self.relay_on else "background-color: gray;")
-                    self.log(f"Button press received → Relay {'ON' if self.relay_on else 'OFF'}")
+        if self._rand_i >= len(self._rand_buf):
+            self._rand_buf = self._rng.uniform(size=(1024,2)) * np.array([12,40]) + np.array([20,30])
+            self._rand_i = 0
+        t, h = self._rand_buf[self._rand_i]
+        self._rand_i += 1
+        self.temp = round(float(t),2)
+        self.hum = round(float(h),2)
+        self.mqtt.publish(SENSOR_PAYLOAD_FMT % (self.temp, self.hum))
+
+    def _handle_msg(self, msg):
+        # Queued-signal slot: runs on the GUI thread for each delivered
+        # message. A batch payload carries several messages at once.
+        if isinstance(msg, dict) and msg.get("type") == "batch":
+            msgs = msg.get("items", [])
+        else:
+            msgs = [msg]
+        for m in msgs:
+            h = self._handlers.get(m.get("type")) if isinstance(m, dict) else None
+            if h:
+                h(m)
+
+    def _on_sensor(self, msg):
+        t = msg.get("temperature")
+        h = msg.get("humidity")
+        if t is None or h is None:
+            return
+        # Auto relay
+        relay = t>=TEMP_THRESHOLD or msg.get("manual_override", False)
+        self._push(t, h)
+        # Timestamp stored as unix seconds, formatted for display only
+        # when the records dialog is opened.
+        self.db.insert(int(time.time()), t, h, int(relay))
+        self._plot_dirty = True
+        self.temp = t
+        self.hum = h
+        # Labels only change when the displayed (1-decimal) value does.
+        temp_txt = f"{t:.1f}"
+        if temp_txt != self._temp_shown:
+            self.lbl_temp.setText(temp_txt)
+            self._temp_shown = temp_txt
+        hum_txt = f"{h:.1f}"
+        if hum_txt != self._hum_shown:
+            self.lbl_hum.setText(hum_txt)
+            self._hum_shown = hum_txt
+        # Warnings
+        if t>=TEMP_THRESHOLD:
+            self.log(f"⚠️ High temperature: {t:.1f}°C")
+        self.relay_on = relay
+        self._apply_relay_style()
+
+    def _on_button(self, msg):
+        # Toggle relay
+        self.relay_on = not self.relay_on
+        self._apply_relay_style()
+        self.log(f"Button press received → Relay {'ON' if self.relay_on else 'OFF'}")
+
+    def _apply_relay_style(self):
+        if self.relay_on != self._relay_applied:
+            self.relay_indicator.setStyleSheet(self._STYLE_ON if self.relay_on else self._STYLE_OFF)
+            self._relay_applied = self.relay_on
+
+    def _on_sys(self, msg):
+        event = msg.get("event", "")
+        detail = msg.get("error", msg.get("rc"))
+        self.log(f"MQTT {event}" + (f" ({detail})" if detail is not None else ""))
+
+    def _push(self, t, h):
+        i = self._head
+        self.temps[i] = t
+        self.hums[i] = h
+        self._head = (i + 1) % self.max_points
+        if self._n < self.max_points:
+            self._n += 1
+
+    def _history(self, arr):
+        # Samples in chronological order (oldest first).
+        if self._n < self.max_points:
+            return arr[:self._n]
+        return np.concatenate((arr[self._head:], arr[:self._head]))
 
     def update_plot(self):
-        ax = self.canvas.ax
-        ax.clear()
-        x = list(range(len(self.temps)))
-        ax.plot(x,list(self.temps),label="Temperature")
-        ax.plot(x,list(self.hums),label="Humidity")
-        ax.set_xlabel("Samples (newest → right)")
-        ax.set_ylabel("Value")
-        ax.grid(True)
-        ax.legend()
-        self.canvas.draw()
+        canvas = self.canvas
+        if canvas.bg is None:
+            canvas.cache_background()
+        canvas.restore_region(canvas.bg)
+        x = self._x[:self._n]
+        canvas.line_t.set_data(x, self._history(self.temps))
+        canvas.line_h.set_data(x, self._history(self.hums))
+        canvas.ax.draw_artist(canvas.line_t)
+        canvas.ax.draw_artist(canvas.line_h)
+        canvas.blit(canvas.ax.bbox)
 
     def on_update(self):
         self.simulate_sensor()
-        self.process_mqtt_queue()
-        self.update_plot()
+        # Only redraw when new samples arrived since the last tick.
+        if self._plot_dirty:
+            self.update_plot()
+            self._plot_dirty = False
+        self.mqtt.flush()
 
     # ✅ פונקציה חדשה להצגת 10 הרשומות האחרונות מה-DB
     def show_last_records(self):
         try:
             records = self.db.get_last_records(10)
+            lines = []
+            for ts, t, h, r in records:
+                # Unix seconds normally; anything else (legacy text rows)
+                # is shown as-is rather than crashing the dialog.
+                if isinstance(ts, (int, float)):
+                    ts = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(ts))
+                lines.append(f"{ts} | Temp: {t:.1f}°C | Hum: {h:.1f}% | Relay: {'ON' if r else 'OFF'}")
         except Exception as e:
             QMessageBox.information(self, "DB Records", f"Error reading DB: {e}")
             return
@@ -273,11 +541,7 @@ class ACDashboard(QWidget):
         if not records:
             QMessageBox.information(self, "DB Records", "No records found in DB.")
             return
-        text = "\n".join([
-            f"{ts} | Temp: {t:.1f}°C | Hum: {h:.1f}% | Relay: {'ON' if r else 'OFF'}"
-            for ts, t, h, r in records
-        ])
-        QMessageBox.information(self, "Last 10 DB Records", text)
+        QMessageBox.information(self, "Last 10 DB Records", "\n".join(lines))
 
     def closeEvent(self,event):
         self.update_timer.stop()